@@ -1,4 +1,3 @@
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core import FinalAnswerTool, ReasoningTool
@@ -26,18 +25,7 @@ class BenchmarkAgent(SGRToolCallingResearchAgent):
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
-        tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
-            tools = {
-                ReasoningTool,
-                FinalAnswerTool,
-            }
-        if self._context.searches_used >= self.max_searches:
-            tools -= {
-                WebSearchTool,
-            }
-
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return self._tools_for_limits([ReasoningTool, FinalAnswerTool], self._function_tools)
 
     async def execute(
         self,
@@ -37,7 +37,11 @@ async def benchmark_agent(question, answer, model_config) -> Dict[str, Any]:
 
         predicted_answer = agent._context.execution_result
 
-        grade_answer_report: GradeAnswerModel = grading_answer(predicted_answer, question, answer, model_config)
+        # grading_answer uses the blocking OpenAI client; run it in a worker thread
+        # so concurrently running agents are not stalled while the judge responds
+        grade_answer_report: GradeAnswerModel = await asyncio.to_thread(
+            grading_answer, predicted_answer, question, answer, model_config
+        )
         grade_answer = grade_answer_report.grade_answer
 
         is_correct_val = grade_answer == "CORRECT"
@@ -88,26 +92,36 @@ async def main(
     if len(problems) != len(answers):
         raise "Problems list and Answer list don't compare"
 
-    total_batches = (len(problems) + batch_size - 1) // batch_size
-
-    for batch_idx, i in enumerate(range(0, len(problems), batch_size), start=1):
-        batch_tasks = problems[i : i + batch_size], answers[i : i + batch_size]
-
-        logger.info(f"Начался батч {batch_idx}/{total_batches} (вопросы {i + 1}-{min(i + batch_size, len(problems))})")
-        logger.debug(f"Batch tasks: {batch_tasks}")
-
-        batch_results = await asyncio.gather(
-            *[benchmark_agent(question, answer, judge_model_config) for question, answer in zip(*batch_tasks)]
-        )
-
-        results.extend(batch_results)
-
-        save_result(results, output_path)
-
-        logger.info(
-            f"Завершен батч {batch_idx}/{total_batches}."
-            f"Обработано вопросов: {len(results)}/{len(problems) + len(results_task if results_task else [])}"
-        )
+    # Up to batch_size questions run at once; a slow question no longer holds back the rest of its batch
+    semaphore = asyncio.Semaphore(batch_size)
+
+    async def run_question(idx: int, question: str, answer: str) -> tuple[int, Dict[str, Any]]:
+        async with semaphore:
+            logger.debug(f"Started question {idx + 1}: {question}")
+            return idx, await benchmark_agent(question, answer, judge_model_config)
+
+    tasks = [
+        asyncio.create_task(run_question(idx, question, answer))
+        for idx, (question, answer) in enumerate(zip(problems, answers))
+    ]
+
+    # Results are saved in question order, so that an interrupted run can be resumed by row count
+    finished_results: Dict[int, Dict[str, Any]] = {}
+    next_idx = 0
+    for finished in asyncio.as_completed(tasks):
+        idx, result = await finished
+        finished_results[idx] = result
+
+        saved_idx = next_idx
+        while next_idx in finished_results:
+            results.append(finished_results.pop(next_idx))
+            next_idx += 1
+
+        if next_idx // batch_size > saved_idx // batch_size or next_idx == len(problems) > saved_idx:
+            save_result(results, output_path)
+            logger.info(
+                f"Обработано вопросов: {len(results)}/{len(problems) + len(results_task if results_task else [])}"
+            )
 
     logger.info("Benchmark completed!")
 
@@ -169,7 +183,7 @@ if __name__ == "__main__":
         type=int,
         required=False,
         default=10,
-        help="Number of samples to process from simpleqa",
+        help="Number of samples to process concurrently",
     )
 
     args = parser.parse_args()
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import Literal
 
 import pandas as pd
@@ -19,8 +20,15 @@ class GradeAnswerModel(BaseModel):
     grade_answer: Literal["CORRECT", "INCORRECT", "NOT_ATTEMPTED"] = Field(..., description="Grade of the answer")
 
 
+@cache
+def get_judge_client(base_url: str, api_key: str) -> OpenAI:
+    """One judge client (and connection pool) per endpoint, shared by all
+    grading calls."""
+    return OpenAI(base_url=base_url, api_key=api_key)
+
+
 def grading_answer(predicted_answer, problem, answer, model_config):
-    client = OpenAI(base_url=model_config["base_url"], api_key=model_config["api_key"])
+    client = get_judge_client(model_config["base_url"], model_config["api_key"])
 
     completion = client.beta.chat.completions.parse(
         model=model_config["model"],
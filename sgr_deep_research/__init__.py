@@ -4,8 +4,10 @@ SGR Deep Research - Schema-Guided Reasoning for Deep Research
 A powerful research assistant that combines structured reasoning with deep analysis capabilities.
 """
 
-from sgr_deep_research.api import *  # noqa: F403
+import importlib as _importlib
+
 from sgr_deep_research.core import *  # noqa: F403
+from sgr_deep_research.core.agents.extensions import SGRToolCallingResearchAgentDeepseek  # noqa: F401
 from sgr_deep_research.services import *  # noqa: F403
 
 __version__ = "0.2.5"
@@ -16,3 +18,34 @@ __all__ = [
     "__version__",
     "__author__",
 ]
+
+
+# Имена, которые отдаёт пакет api; только для них стоит загружать веб-слой.
+# Список должен совпадать с __all__ в sgr_deep_research/api/models.py
+_API_EXPORTS = frozenset(
+    {
+        "api",
+        "AgentModel",
+        "AGENT_MODEL_MAPPING",
+        "ChatMessage",
+        "ChatCompletionRequest",
+        "ChatCompletionChoice",
+        "ChatCompletionResponse",
+        "HealthResponse",
+        "AgentStateResponse",
+        "AgentListItem",
+        "AgentListResponse",
+        "ClarificationRequest",
+    }
+)
+
+
+def __getattr__(name: str):
+    """Import the API layer (FastAPI models and endpoints) on first access
+    only, so that agents can be used without loading the web stack."""
+    if name in _API_EXPORTS:
+        api = _importlib.import_module(f"{__name__}.api")
+        value = api if name == "api" else getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,15 +3,17 @@
 import argparse
 import logging
 import os
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 
 from sgr_deep_research import __version__
 from sgr_deep_research.api.endpoints import router
+from sgr_deep_research.core.agents.base_agent import get_openai_client
+from sgr_deep_research.core.tools import NextStepToolsBuilder, research_agent_tools, system_agent_tools
 from sgr_deep_research.services import MCP2ToolConverter
-from sgr_deep_research.settings import setup_logging
+from sgr_deep_research.settings import get_config, setup_logging
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -19,8 +21,21 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await MCP2ToolConverter().build_tools_from_mcp()
-    yield
+    mcp_converter = MCP2ToolConverter()
+    await mcp_converter.build_tools_from_mcp()
+    # Прогрев: схемы и валидаторы инструментов компилируются до первого запроса, а не во время него
+    NextStepToolsBuilder.build_NextStepTools(
+        [*system_agent_tools, *research_agent_tools, *mcp_converter.toolkit]
+    ).model_json_schema()
+    async with AsyncExitStack() as stack:
+        # Общий пул соединений OpenAI закрывается при остановке сервера, а затем сбрасывается из кэша,
+        # чтобы следующий запуск приложения в том же процессе получил новый клиент (колбэки идут в обратном порядке)
+        stack.callback(get_openai_client.cache_clear)
+        stack.push_async_callback(get_openai_client().close)
+        if get_config().mcp.transport_config:
+            # Сессия MCP открыта на всё время работы сервера, вызовы инструментов переиспользуют её
+            await stack.enter_async_context(mcp_converter.client)
+        yield
 
 
 app = FastAPI(title="SGR Deep Research API", version=__version__, lifespan=lifespan)
@@ -1,8 +1,9 @@
 import asyncio
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from sgr_deep_research.api.models import (
     AGENT_MODEL_MAPPING,
@@ -41,7 +42,7 @@ async def get_agent_state(agent_id: str):
         agent_id=agent.id,
         task=agent.task,
         sources_count=len(agent._context.sources),
-        **agent._context.model_dump(),
+        **agent._context.agent_state(),
     )
 
 
@@ -60,16 +61,22 @@ async def get_agents_list():
     return AgentListResponse(agents=agents_list, total=len(agents_list))
 
 
-@router.get("/v1/models")
-async def get_available_models():
-    """Get list of available agent models."""
-    return {
+# Список моделей статичен, поэтому сериализуется один раз при импорте
+_available_models_body = orjson.dumps(
+    {
         "data": [
             {"id": model.value, "object": "model", "created": 1234567890, "owned_by": "sgr-deep-research"}
             for model in AgentModel
         ],
         "object": "list",
     }
+)
+
+
+@router.get("/v1/models")
+async def get_available_models():
+    """Get list of available agent models."""
+    return Response(content=_available_models_body, media_type="application/json")
 
 
 def extract_user_content_from_messages(messages):
@@ -15,6 +15,20 @@ from sgr_deep_research.core.agents import (
 )
 from sgr_deep_research.core.agents.extensions import SGRToolCallingResearchAgentDeepseek
 
+__all__ = [
+    "AgentModel",
+    "AGENT_MODEL_MAPPING",
+    "ChatMessage",
+    "ChatCompletionRequest",
+    "ChatCompletionChoice",
+    "ChatCompletionResponse",
+    "HealthResponse",
+    "AgentStateResponse",
+    "AgentListItem",
+    "AgentListResponse",
+    "ClarificationRequest",
+]
+
 
 class AgentModel(str, Enum):
     """Available agent models for chat completion."""
@@ -1,16 +1,18 @@
-import json
+import asyncio
 import logging
 import os
 import traceback
 import uuid
 from datetime import datetime
-from typing import Type
+from functools import cache
+from typing import Any, Callable, Type
 
 import httpx
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
-from sgr_deep_research.core.models import AgentStatesEnum, ResearchContext
+from sgr_deep_research.core.models import AGENT_FINISH_STATES, AgentStatesEnum, ResearchContext
 from sgr_deep_research.core.prompts import PromptLoader
 from sgr_deep_research.core.stream import OpenAIStreamingGenerator
 from sgr_deep_research.core.tools import (
@@ -18,12 +20,36 @@ from sgr_deep_research.core.tools import (
     BaseTool,
     ClarificationTool,
     ReasoningTool,
+    WebSearchTool,
     system_agent_tools,
 )
 from sgr_deep_research.settings import get_config
 
 config = get_config()
 
+# Number of streamed chunks after which control is handed back to the event loop
+STREAM_YIELD_INTERVAL = 32
+
+
+@cache
+def get_openai_client() -> AsyncOpenAI:
+    """OpenAI client shared by all agents, so that concurrent agents reuse
+    one HTTP connection pool instead of opening their own.
+
+    Pooled connections are bound to the event loop that first uses them:
+    the server closes the client on shutdown, and scripts that call
+    ``asyncio.run`` more than once should ``await get_openai_client().close()``
+    and ``get_openai_client.cache_clear()`` before starting a new loop.
+    """
+    http_client_kwargs = {"limits": httpx.Limits(max_connections=200, max_keepalive_connections=100)}
+    if config.openai.proxy.strip():
+        http_client_kwargs["proxy"] = config.openai.proxy
+    return AsyncOpenAI(
+        base_url=config.openai.base_url,
+        api_key=config.openai.api_key,
+        http_client=DefaultAsyncHttpxClient(**http_client_kwargs),
+    )
+
 
 class BaseAgent:
     """Base class for agents."""
@@ -36,6 +62,7 @@ class BaseAgent:
         toolkit: list[Type[BaseTool]] | None = None,
         max_iterations: int = 20,
         max_clarifications: int = 3,
+        max_searches: int = 4,
     ):
         self.id = f"{self.name}_{uuid.uuid4()}"
         self.logger = logging.getLogger(f"sgr_deep_research.agents.{self.id}")
@@ -48,12 +75,11 @@ class BaseAgent:
         self.log = []
         self.max_iterations = max_iterations
         self.max_clarifications = max_clarifications
+        self.max_searches = max_searches
+        # Набор инструментов зависит только от исчерпанных лимитов, поэтому строится один раз на состояние
+        self._tools_cache: dict[tuple[bool, bool, bool], Any] = {}
 
-        client_kwargs = {"base_url": config.openai.base_url, "api_key": config.openai.api_key}
-        if config.openai.proxy.strip():
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=config.openai.proxy)
-
-        self.openai_client = AsyncOpenAI(**client_kwargs)
+        self.openai_client = get_openai_client()
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
 
     async def provide_clarification(self, clarifications: str):
@@ -65,9 +91,10 @@ class BaseAgent:
         self.logger.info(f"✅ Clarification received: {clarifications[:2000]}...")
 
     def _log_reasoning(self, result: ReasoningTool) -> None:
-        next_step = result.remaining_steps[0] if result.remaining_steps else "Completing"
-        self.logger.info(
-            f"""
+        if self.logger.isEnabledFor(logging.INFO):
+            next_step = result.remaining_steps[0] if result.remaining_steps else "Completing"
+            self.logger.info(
+                f"""
     ###############################################
     🤖 LLM RESPONSE DEBUG:
        🧠 Reasoning Steps: {result.reasoning_steps}
@@ -80,7 +107,7 @@ class BaseAgent:
        🏁 Task Completed: {result.task_completed}
        ➡️ Next Step: {next_step}
     ###############################################"""
-        )
+            )
         self.log.append(
             {
                 "step_number": self._context.iteration,
@@ -91,15 +118,16 @@ class BaseAgent:
         )
 
     def _log_tool_execution(self, tool: BaseTool, result: str):
-        self.logger.info(
-            f"""
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"""
 ###############################################
 🛠️ TOOL EXECUTION DEBUG:
     🔧 Tool Name: {tool.tool_name}
     📋 Tool Model: {tool.model_dump_json(indent=2)}
     🔍 Result: '{result[:400]}...'
 ###############################################"""
-        )
+            )
         self.log.append(
             {
                 "step_number": self._context.iteration,
@@ -123,7 +151,23 @@ class BaseAgent:
             "log": self.log,
         }
 
-        json.dump(agent_log, open(filepath, "w", encoding="utf-8"), indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(agent_log, option=orjson.OPT_INDENT_2))
+
+    async def _stream_chunks(self, stream):
+        """Iterate over chunk events of a completion stream.
+
+        Periodically yields to the event loop so that concurrent agents
+        and HTTP handlers are not starved by bursts of buffered chunks.
+        """
+        count = 0
+        async for event in stream:
+            if event.type != "chunk":
+                continue
+            yield event
+            count += 1
+            if count % STREAM_YIELD_INTERVAL == 0:
+                await asyncio.sleep(0)
 
     async def _prepare_context(self) -> list[dict]:
         """Prepare conversation context with system prompt."""
@@ -136,6 +180,29 @@ class BaseAgent:
         """Prepare available tools for current agent state and progress."""
         raise NotImplementedError("_prepare_tools must be implemented by subclass")
 
+    @staticmethod
+    def _function_tools(tools: list[Type[BaseTool]]) -> list[ChatCompletionFunctionToolParam]:
+        """Convert tool classes to OpenAI function tool definitions."""
+        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+
+    def _tools_for_limits(self, final_tools: list[Type[BaseTool]], build: Callable[[list[Type[BaseTool]]], Any]):
+        """Select tools allowed by the current limits and convert them with
+        build; once iterations are exhausted only final_tools remain."""
+        iterations_exhausted = self._context.iteration >= self.max_iterations
+        clarifications_exhausted = self._context.clarifications_used >= self.max_clarifications
+        searches_exhausted = self._context.searches_used >= self.max_searches
+        cache_key = (iterations_exhausted, clarifications_exhausted, searches_exhausted)
+        if cache_key not in self._tools_cache:
+            # Порядок инструментов задаёт toolkit, чтобы схема запроса не менялась между шагами и процессами
+            candidates = final_tools if iterations_exhausted else self.toolkit
+            excluded = set()
+            if clarifications_exhausted:
+                excluded.add(ClarificationTool)
+            if searches_exhausted:
+                excluded.add(WebSearchTool)
+            self._tools_cache[cache_key] = build([tool for tool in dict.fromkeys(candidates) if tool not in excluded])
+        return self._tools_cache[cache_key]
+
     async def _reasoning_phase(self) -> ReasoningTool:
         """Call LLM to decide next action based on current context."""
         raise NotImplementedError("_reasoning_phase must be implemented by subclass")
@@ -152,7 +219,13 @@ class BaseAgent:
 
         Returns string or dumped json result of the tool execution.
         """
-        raise NotImplementedError("_action_phase must be implemented by subclass")
+        result = await tool(self._context)
+        self.conversation.append(
+            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
+        )
+        self.streaming_generator.add_chunk_from_str(f"{result}\n")
+        self._log_tool_execution(tool, result)
+        return result
 
     async def execute(
         self,
@@ -167,7 +240,7 @@ class BaseAgent:
             ]
         )
         try:
-            while self._context.state not in AgentStatesEnum.FINISH_STATES.value:
+            while self._context.state not in AGENT_FINISH_STATES:
                 self._context.iteration += 1
                 self.logger.info(f"Step {self._context.iteration} started")
 
@@ -7,6 +7,7 @@ from sgr_deep_research.core.tools import ReasoningTool
 
 config = get_config()
 
+
 class SGRToolCallingResearchAgentDeepseek(SGRToolCallingResearchAgent):
     """Agent that uses OpenAI native function calling to select and execute
     tools based on SGR like reasoning scheme.
@@ -19,14 +20,17 @@ class SGRToolCallingResearchAgentDeepseek(SGRToolCallingResearchAgent):
         # Provide ONLY ReasoningTool to the model on the reasoning step
         msgs = await self._prepare_context()
         last_message = msgs[-1]
-        if not isinstance(last_message.get("content"), str):
-            last_message["content"] = last_message.get("content") or ""
+        content = last_message.get("content")
+        if not isinstance(content, str):
+            content = content or ""
         # Build concise instruction from the tool's schema (with enums, constraints)
         instruction = ReasoningTool.schema_to_instruction(
             prefix="[REASONING_REQUIRED] Produce ReasoningTool arguments strictly per schema:",
             suffix="Be concise, factual, and use the user's language.",
         )
-        last_message["content"] += "\n\n" + instruction
+        # Replace the message with a copy: the dict is shared with self.conversation,
+        # and the instruction must not accumulate in history on every step
+        msgs[-1] = {**last_message, "content": content + "\n\n" + instruction}
         async with self.openai_client.chat.completions.stream(
             model=config.openai.model,
             messages=msgs,
@@ -35,9 +39,9 @@ class SGRToolCallingResearchAgentDeepseek(SGRToolCallingResearchAgent):
             tools=[pydantic_function_tool(ReasoningTool, name=ReasoningTool.tool_name, description="")],
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event.chunk)
             reasoning: ReasoningTool = (
                 (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
             )
@@ -3,13 +3,11 @@ from typing import Type
 from sgr_deep_research.core.agents.base_agent import BaseAgent
 from sgr_deep_research.core.tools import (
     BaseTool,
-    ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
     NextStepToolsBuilder,
     NextStepToolStub,
     ReasoningTool,
-    WebSearchTool,
     research_agent_tools,
     system_agent_tools,
 )
@@ -37,6 +35,7 @@ class SGRResearchAgent(BaseAgent):
             toolkit=toolkit,
             max_clarifications=max_clarifications,
             max_iterations=max_iterations,
+            max_searches=max_searches,
         )
 
         self.toolkit = [
@@ -46,25 +45,10 @@ class SGRResearchAgent(BaseAgent):
             *(toolkit or []),
         ]
         self.toolkit.remove(ReasoningTool)  # we use our own reasoning scheme
-        self.max_searches = max_searches
 
     async def _prepare_tools(self) -> Type[NextStepToolStub]:
         """Prepare tool classes with current context limits."""
-        tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
-            tools = {
-                CreateReportTool,
-                FinalAnswerTool,
-            }
-        if self._context.clarifications_used >= self.max_clarifications:
-            tools -= {
-                ClarificationTool,
-            }
-        if self._context.searches_used >= self.max_searches:
-            tools -= {
-                WebSearchTool,
-            }
-        return NextStepToolsBuilder.build_NextStepTools(list(tools))
+        return self._tools_for_limits([CreateReportTool, FinalAnswerTool], NextStepToolsBuilder.build_NextStepTools)
 
     async def _reasoning_phase(self) -> NextStepToolStub:
         async with self.openai_client.chat.completions.stream(
@@ -74,9 +58,9 @@ class SGRResearchAgent(BaseAgent):
             max_tokens=config.openai.max_tokens,
             temperature=config.openai.temperature,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event)
         reasoning: NextStepToolStub = (await stream.get_final_completion()).choices[0].message.parsed  # type: ignore
         # we are not fully sure if it should be in conversation or not. Looks like not necessary data
         # self.conversation.append({"role": "assistant", "content": reasoning.model_dump_json(exclude={"function"})})
@@ -87,6 +71,7 @@ class SGRResearchAgent(BaseAgent):
         tool = reasoning.function
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -97,26 +82,15 @@ class SGRResearchAgent(BaseAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
 
-    async def _action_phase(self, tool: BaseTool) -> str:
-        result = await tool(self._context)
-        self.conversation.append(
-            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
-        )
-        self.streaming_generator.add_chunk_from_str(f"{result}\n")
-        self._log_tool_execution(tool, result)
-        return result
-
 
 if __name__ == "__main__":
     import asyncio
@@ -20,9 +20,9 @@ class SGRSOToolCallingResearchAgent(SGRToolCallingResearchAgent):
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event.chunk)
             reasoning: ReasoningTool = (  # noqa
                 (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments  #
             )
@@ -33,9 +33,9 @@ class SGRSOToolCallingResearchAgent(SGRToolCallingResearchAgent):
             max_tokens=config.openai.max_tokens,
             temperature=config.openai.temperature,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event)
         reasoning: ReasoningTool = (await stream.get_final_completion()).choices[0].message.parsed
         tool_call_result = await reasoning(self._context)
         self.conversation.append(
@@ -1,17 +1,14 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.sgr_agent import SGRResearchAgent
 from sgr_deep_research.core.models import AgentStatesEnum
 from sgr_deep_research.core.tools import (
     BaseTool,
-    ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
     ReasoningTool,
-    WebSearchTool,
     research_agent_tools,
     system_agent_tools,
 )
@@ -52,22 +49,7 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare available tools for current agent state and progress."""
-        tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
-            tools = {
-                ReasoningTool,
-                CreateReportTool,
-                FinalAnswerTool,
-            }
-        if self._context.clarifications_used >= self.max_clarifications:
-            tools -= {
-                ClarificationTool,
-            }
-        if self._context.searches_used >= self.max_searches:
-            tools -= {
-                WebSearchTool,
-            }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return self._tools_for_limits([ReasoningTool, CreateReportTool, FinalAnswerTool], self._function_tools)
 
     async def _reasoning_phase(self) -> ReasoningTool:
         async with self.openai_client.chat.completions.stream(
@@ -78,9 +60,9 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools=await self._prepare_tools(),
             tool_choice={"type": "function", "function": {"name": ReasoningTool.tool_name}},
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event.chunk)
             reasoning: ReasoningTool = (
                 (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
             )
@@ -116,9 +98,9 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event.chunk)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event.chunk)
 
         completion = await stream.get_final_completion()
 
@@ -134,6 +116,7 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
             )
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -144,13 +127,11 @@ class SGRToolCallingResearchAgent(SGRResearchAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
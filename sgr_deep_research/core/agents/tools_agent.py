@@ -1,16 +1,13 @@
 from typing import Literal, Type
 
-from openai import pydantic_function_tool
 from openai.types.chat import ChatCompletionFunctionToolParam
 
 from sgr_deep_research.core.agents.base_agent import BaseAgent
 from sgr_deep_research.core.tools import (
     BaseTool,
-    ClarificationTool,
     CreateReportTool,
     FinalAnswerTool,
     ReasoningTool,
-    WebSearchTool,
     research_agent_tools,
     system_agent_tools,
 )
@@ -39,6 +36,7 @@ class ToolCallingResearchAgent(BaseAgent):
             toolkit=toolkit,
             max_clarifications=max_clarifications,
             max_iterations=max_iterations,
+            max_searches=max_searches,
         )
 
         self.toolkit = [
@@ -49,26 +47,11 @@ class ToolCallingResearchAgent(BaseAgent):
         ]
         self.toolkit.remove(ReasoningTool)  # LLM will do the reasoning internally
 
-        self.max_searches = max_searches
         self.tool_choice: Literal["required"] = "required"
 
     async def _prepare_tools(self) -> list[ChatCompletionFunctionToolParam]:
         """Prepare tool classes with current context limits."""
-        tools = set(self.toolkit)
-        if self._context.iteration >= self.max_iterations:
-            tools = {
-                CreateReportTool,
-                FinalAnswerTool,
-            }
-        if self._context.clarifications_used >= self.max_clarifications:
-            tools -= {
-                ClarificationTool,
-            }
-        if self._context.searches_used >= self.max_searches:
-            tools -= {
-                WebSearchTool,
-            }
-        return [pydantic_function_tool(tool, name=tool.tool_name, description="") for tool in tools]
+        return self._tools_for_limits([CreateReportTool, FinalAnswerTool], self._function_tools)
 
     async def _reasoning_phase(self) -> None:
         """No explicit reasoning phase, reasoning is done internally by LLM."""
@@ -83,13 +66,14 @@ class ToolCallingResearchAgent(BaseAgent):
             tools=await self._prepare_tools(),
             tool_choice=self.tool_choice,
         ) as stream:
-            async for event in stream:
-                if event.type == "chunk":
-                    self.streaming_generator.add_chunk(event)
+            add_chunk = self.streaming_generator.add_chunk
+            async for event in self._stream_chunks(stream):
+                add_chunk(event)
         tool = (await stream.get_final_completion()).choices[0].message.tool_calls[0].function.parsed_arguments
 
         if not isinstance(tool, BaseTool):
             raise ValueError("Selected tool is not a valid BaseTool instance")
+        tool_arguments = tool.model_dump_json()
         self.conversation.append(
             {
                 "role": "assistant",
@@ -100,22 +84,11 @@ class ToolCallingResearchAgent(BaseAgent):
                         "id": f"{self._context.iteration}-action",
                         "function": {
                             "name": tool.tool_name,
-                            "arguments": tool.model_dump_json(),
+                            "arguments": tool_arguments,
                         },
                     }
                 ],
             }
         )
-        self.streaming_generator.add_tool_call(
-            f"{self._context.iteration}-action", tool.tool_name, tool.model_dump_json()
-        )
+        self.streaming_generator.add_tool_call(f"{self._context.iteration}-action", tool.tool_name, tool_arguments)
         return tool
-
-    async def _action_phase(self, tool: BaseTool) -> str:
-        result = await tool(self._context)
-        self.conversation.append(
-            {"role": "tool", "content": result, "tool_call_id": f"{self._context.iteration}-action"}
-        )
-        self.streaming_generator.add_chunk_from_str(f"{result}\n")
-        self._log_tool_execution(tool, result)
-        return result
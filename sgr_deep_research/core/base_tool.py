@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
+from functools import cache
 from typing import TYPE_CHECKING, ClassVar
 
+import orjson
 from fastmcp import Client
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 # from sgr_deep_research.core.models import AgentStatesEnum
 from sgr_deep_research.settings import get_config
@@ -20,10 +21,14 @@ logger = logging.getLogger(__name__)
 class BaseTool(BaseModel):
     """Class to provide tool handling capabilities."""
 
+    # Аргументы инструмента не меняются после разбора ответа LLM
+    model_config = ConfigDict(frozen=True)
+
     tool_name: ClassVar[str] = None
     description: ClassVar[str] = None
 
     @classmethod
+    @cache
     def schema_to_instruction(
             cls,
             prefix: str = "",
@@ -45,6 +50,9 @@ class BaseTool(BaseModel):
             include_defaults: Whether to show default values
             enum_limit: Maximum enum values to show
             max_depth: Maximum recursion depth for nested objects
+
+        The JSON Schema of a model does not change at runtime, so the result
+        is cached per model class and argument set.
         """
 
         def process_schema(
@@ -70,12 +78,13 @@ class BaseTool(BaseModel):
 
             def summarize_type(meta: dict) -> str | None:
                 """Extract and format type information"""
-                # Обработка $ref
-                if "$ref" in meta:
-                    ref_schema = resolve_ref(meta["$ref"])
-                    if ref_schema.get("type") == "object":
+                # Обработка $ref: цепочки ссылок разворачиваются циклом, без рекурсии
+                seen_refs = set()
+                while "$ref" in meta and meta["$ref"] not in seen_refs:
+                    seen_refs.add(meta["$ref"])
+                    meta = resolve_ref(meta["$ref"])
+                    if meta.get("type") == "object":
                         return "object"
-                    return summarize_type(ref_schema)
 
                 t = meta.get("type")
 
@@ -222,7 +231,7 @@ class MCPBaseTool(BaseTool):
         try:
             async with self._client:
                 result = await self._client.call_tool(self.tool_name, payload)
-                return json.dumps([m.model_dump_json() for m in result.content], ensure_ascii=False)[
+                return orjson.dumps([m.model_dump(mode="json") for m in result.content]).decode()[
                     : config.mcp.context_limit
                 ]
         except Exception as e:
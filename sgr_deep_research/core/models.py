@@ -43,6 +43,13 @@ class AgentStatesEnum(str, Enum):
     FINISH_STATES = {COMPLETED, FAILED, ERROR}
 
 
+# Финальные состояния для проверки в цикле агента. FINISH_STATES.value у str-enum
+# превращается в строку, и `in` по нему работает как поиск подстроки
+AGENT_FINISH_STATES: frozenset[AgentStatesEnum] = frozenset(
+    {AgentStatesEnum.COMPLETED, AgentStatesEnum.FAILED, AgentStatesEnum.ERROR}
+)
+
+
 class ResearchContext(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
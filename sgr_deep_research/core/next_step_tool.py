@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import operator
 from abc import ABC
-from functools import reduce
+from functools import cache, reduce
 from typing import Annotated, Literal, Type, TypeVar
 
 from pydantic import BaseModel, Field, create_model
@@ -42,9 +42,14 @@ class NextStepToolsBuilder:
     pydantic models level."""
 
     @classmethod
+    @cache
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
         """Create discriminant version of tool with tool_name as instance
-        field."""
+        field.
+
+        Cached per tool class: model creation compiles a new pydantic-core
+        validator, which would otherwise happen for every tool on every step.
+        """
 
         return create_model(  # noqa
             f"D_{tool_class.__name__}",
@@ -27,6 +27,12 @@ class PromptLoader:
 
     @classmethod
     def get_system_prompt(cls, available_tools: list[BaseTool]) -> str:
+        return cls._render_system_prompt(tuple(available_tools))
+
+    @classmethod
+    @cache
+    def _render_system_prompt(cls, available_tools: tuple[BaseTool, ...]) -> str:
+        # Системный промпт зависит только от набора инструментов, поэтому рендерится один раз на набор
         template = cls._load_prompt_file(config.prompts.system_prompt_file)
         available_tools_str_list = [
             f"{i}. {tool.tool_name}: {tool.description}" for i, tool in enumerate(available_tools, start=1)
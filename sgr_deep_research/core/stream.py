@@ -1,7 +1,7 @@
 import asyncio
-import json
 import time
 
+import orjson
 from openai.types.chat import ChatCompletionChunk
 
 
@@ -16,11 +16,20 @@ class StreamingGenerator:
         self.queue.put_nowait(None)  # Завершающий сигнал
 
     async def stream(self):
-        while True:
+        finished = False
+        while not finished:
             data = await self.queue.get()
             if data is None:  # Завершающий символ
                 break
-            yield data
+            # Забираем всё, что уже накопилось в очереди, и отдаём одной записью
+            batch = [data]
+            while not self.queue.empty():
+                data = self.queue.get_nowait()
+                if data is None:
+                    finished = True
+                    break
+                batch.append(data)
+            yield "".join(batch)
 
 
 class OpenAIStreamingGenerator(StreamingGenerator):
@@ -53,7 +62,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             ],
             "usage": None,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        super().add(f"data: {orjson.dumps(response).decode()}\n\n")
 
     def add_tool_call(self, tool_call_id: str, function_name: str, arguments: str):
         """Добавляет tool call chunk."""
@@ -62,7 +71,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "object": "chat.completion.chunk",
             "created": self.created,
             "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
+            "system_fingerprint": self.fingerprint,
             "choices": [
                 {
                     "delta": {
@@ -82,7 +91,7 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             ],
             "usage": None,
         }
-        super().add(f"data: {json.dumps(response)}\n\n")
+        super().add(f"data: {orjson.dumps(response).decode()}\n\n")
 
     def finish(self, finish_reason: str = "stop"):
         """Завершает stream с финальным chunk и usage."""
@@ -91,10 +100,10 @@ class OpenAIStreamingGenerator(StreamingGenerator):
             "object": "chat.completion.chunk",
             "created": self.created,
             "model": self.model,
-            "system_fingerprint": f"fp_{hex(hash(self.model))[-8:]}",
+            "system_fingerprint": self.fingerprint,
             "choices": [{"index": self.choice_index, "delta": {}, "logprobs": None, "finish_reason": finish_reason}],
             "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
         }
-        super().add(f"data: {json.dumps(final_response)}\n\n")
+        super().add(f"data: {orjson.dumps(final_response).decode()}\n\n")
         super().add("data: [DONE]\n\n")
         super().finish()
@@ -21,7 +21,6 @@ class AdaptPlanTool(BaseTool):
 
     async def __call__(self, context: ResearchContext) -> str:
         return self.model_dump_json(
-            indent=2,
             exclude={
                 "reasoning",
             },
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
+import orjson
 from pydantic import Field
 
 from sgr_deep_research.core.base_tool import BaseTool
@@ -50,18 +50,21 @@ class CreateReportTool(BaseTool):
         filepath = os.path.join(reports_dir, filename)
 
         # Format full report with sources
-        full_content = f"# {self.title}\n\n"
-        full_content += f"*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
-        full_content += self.content + "\n\n"
+        parts = [
+            f"# {self.title}\n\n",
+            f"*Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n",
+            self.content,
+            "\n\n",
+        ]
 
         # Add sources reference section
         if context.sources:
-            full_content += "---\n\n"
-            full_content += "## Источники / Sources\n\n"
-            full_content += "\n".join([str(source) for source in context.sources.values()])
+            parts.append("---\n\n")
+            parts.append("## Источники / Sources\n\n")
+            parts.append("\n".join(str(source) for source in context.sources.values()))
 
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(full_content)
+            f.write("".join(parts))
 
         report = {
             "title": self.title,
@@ -82,4 +85,4 @@ class CreateReportTool(BaseTool):
             f"   📊 Words: {report['word_count']}, Sources: {report['sources_count']}\n"
             f"   💾 Saved: {filepath}\n"
         )
-        return json.dumps(report, indent=2, ensure_ascii=False)
+        return orjson.dumps(report).decode()
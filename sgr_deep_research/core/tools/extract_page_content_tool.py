@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from sgr_deep_research.core.base_tool import BaseTool
 from sgr_deep_research.services.tavily_search import TavilySearchService
@@ -36,16 +36,18 @@ class ExtractPageContentTool(BaseTool):
     reasoning: str = Field(description="Why extract these specific pages")
     urls: list[str] = Field(description="List of URLs to extract full content from", min_length=1, max_length=5)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
+    _search_service: TavilySearchService = PrivateAttr(default_factory=TavilySearchService)
 
     async def __call__(self, context: ResearchContext) -> str:
         """Extract full content from specified URLs."""
 
-        logger.info(f"📄 Extracting content from {len(self.urls)} URLs")
+        # Страницы, полный текст которых уже есть в контексте, повторно не запрашиваются
+        urls_to_extract = [
+            url for url in self.urls if url not in context.sources or not context.sources[url].full_content
+        ]
+        logger.info(f"📄 Extracting content from {len(urls_to_extract)} of {len(self.urls)} URLs")
 
-        sources = await self._search_service.extract(urls=self.urls)
+        sources = await self._search_service.extract(urls=urls_to_extract) if urls_to_extract else []
 
         # Update existing sources instead of overwriting
         for source in sources:
@@ -59,7 +61,7 @@ class ExtractPageContentTool(BaseTool):
                 source.number = len(context.sources) + 1
                 context.sources[source.url] = source
 
-        formatted_result = "Extracted Page Content:\n\n"
+        parts = ["Extracted Page Content:\n\n"]
 
         # Format results using sources from context (to get correct numbers)
         for url in self.urls:
@@ -67,14 +69,15 @@ class ExtractPageContentTool(BaseTool):
                 source = context.sources[url]
                 if source.full_content:
                     content_preview = source.full_content[: config.scraping.content_limit]
-                    formatted_result += (
+                    parts.append(
                         f"{str(source)}\n\n**Full Content:**\n"
                         f"{content_preview}\n\n"
                         f"*[Content length: {len(content_preview)} characters]*\n\n"
                         "---\n\n"
                     )
                 else:
-                    formatted_result += f"{str(source)}\n*Failed to extract content*\n\n"
+                    parts.append(f"{str(source)}\n*Failed to extract content*\n\n")
 
+        formatted_result = "".join(parts)
         logger.debug(formatted_result[:500])
         return formatted_result
@@ -23,7 +23,6 @@ class GeneratePlanTool(BaseTool):
 
     async def __call__(self, context: ResearchContext) -> str:
         return self.model_dump_json(
-            indent=2,
             exclude={
                 "reasoning",
             },
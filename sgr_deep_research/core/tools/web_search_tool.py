@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from sgr_deep_research.core.base_tool import BaseTool
 from sgr_deep_research.core.models import SearchResult
@@ -53,9 +53,7 @@ class WebSearchTool(BaseTool):
         le=10,
     )
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        self._search_service = TavilySearchService()
+    _search_service: TavilySearchService = PrivateAttr(default_factory=TavilySearchService)
 
     async def __call__(self, context: ResearchContext) -> str:
         """Execute web search using TavilySearchService."""
@@ -81,13 +79,16 @@ class WebSearchTool(BaseTool):
         )
         context.searches.append(search_result)
 
-        formatted_result = f"Search Query: {search_result.query}\n\n"
-        formatted_result += "Search Results (titles, links, short snippets):\n\n"
+        parts = [
+            f"Search Query: {search_result.query}\n\n",
+            "Search Results (titles, links, short snippets):\n\n",
+        ]
 
         for source in sources:
             snippet = source.snippet[:100] + "..." if len(source.snippet) > 100 else source.snippet
-            formatted_result += f"{str(source)}\n{snippet}\n\n"
+            parts.append(f"{str(source)}\n{snippet}\n\n")
 
         context.searches_used += 1
+        formatted_result = "".join(parts)
         logger.debug(formatted_result)
         return formatted_result
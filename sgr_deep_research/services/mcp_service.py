@@ -6,22 +6,12 @@ from jambo import SchemaConverter
 from pydantic import create_model
 
 from sgr_deep_research.core.tools import BaseTool, MCPBaseTool
+from sgr_deep_research.services.singleton import Singleton
 from sgr_deep_research.settings import get_config
 
 logger = logging.getLogger(__name__)
 
 
-class Singleton(type):
-    """Singleton metaclass."""
-
-    _instances = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
-
-
 class MCP2ToolConverter(metaclass=Singleton):
     def __init__(self):
         self.toolkit: list[Type[BaseTool]] = []
@@ -0,0 +1,17 @@
+import threading
+
+
+class Singleton(type):
+    """Singleton metaclass."""
+
+    _instances = {}
+    # Реентерабельная блокировка: __init__ одного синглтона может создавать другой синглтон
+    _lock = threading.RLock()
+
+    def __call__(cls, *args, **kwargs):
+        # Двойная проверка: блокировка берётся только пока экземпляр ещё не создан
+        if cls not in cls._instances:
+            with Singleton._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
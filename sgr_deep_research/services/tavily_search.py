@@ -1,18 +1,31 @@
 import logging
+import time
+from collections import OrderedDict
 
 from tavily import AsyncTavilyClient
 
 from sgr_deep_research.core.models import SourceData
+from sgr_deep_research.services.singleton import Singleton
 from sgr_deep_research.settings import get_config
 
 logger = logging.getLogger(__name__)
 
 
-class TavilySearchService:
+class TavilySearchService(metaclass=Singleton):
     def __init__(self):
         config = get_config()
         self._client = AsyncTavilyClient(api_key=config.tavily.api_key, api_base_url=config.tavily.api_base_url)
         self._config = config
+        # The service is a singleton, so this LRU of search results is shared by the whole process;
+        # entries are keyed by request parameters and stored with their expiry time
+        self._search_cache: OrderedDict[tuple[str, int, bool], tuple[float, list[SourceData]]] = OrderedDict()
+        self._search_cache_size = config.search.cache_size
+        self._search_cache_ttl = config.search.cache_ttl
+        # Extracted pages are large, so their LRU is keyed by URL and bounded by total characters stored
+        self._extract_cache: OrderedDict[str, tuple[float, SourceData]] = OrderedDict()
+        self._extract_cache_size = config.search.extract_cache_size
+        self._extract_cache_ttl = config.search.extract_cache_ttl
+        self._extract_cache_chars = 0
 
     @staticmethod
     def rearrange_sources(sources: list[SourceData], starting_number=1) -> list[SourceData]:
@@ -38,6 +51,19 @@ class TavilySearchService:
             Tuple with tavily answer and list of SourceData
         """
         max_results = max_results or self._config.search.max_results
+        cache_key = (query, max_results, include_raw_content)
+        cached_entry = self._search_cache.get(cache_key)
+        if cached_entry is not None and cached_entry[0] <= time.monotonic():
+            # Search results go stale, so an expired entry is dropped
+            del self._search_cache[cache_key]
+            cached_entry = None
+        if cached_entry is not None:
+            self._search_cache.move_to_end(cache_key)
+            cached = cached_entry[1]
+            logger.info(f"🔍 Tavily search (cached): '{query}' (max_results={max_results})")
+            # Callers renumber and enrich sources in place, so never hand out cached objects
+            return [source.model_copy() for source in cached]
+
         logger.info(f"🔍 Tavily search: '{query}' (max_results={max_results})")
 
         # Execute search through Tavily
@@ -49,6 +75,12 @@ class TavilySearchService:
 
         # Convert results to SourceData
         sources = self._convert_to_source_data(response)
+        self._search_cache[cache_key] = (
+            time.monotonic() + self._search_cache_ttl,
+            [source.model_copy() for source in sources],
+        )
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
         return sources
 
     async def extract(self, urls: list[str]) -> list[SourceData]:
@@ -60,30 +92,70 @@ class TavilySearchService:
         Returns:
             List of SourceData with extracted content
         """
-        logger.info(f"📄 Tavily extract: {len(urls)} URLs")
-
-        response = await self._client.extract(urls=urls)
-
-        sources = []
-        for i, result in enumerate(response.get("results", [])):
-            if not result.get("url"):
+        cached: dict[str, SourceData] = {}
+        now = time.monotonic()
+        for url in urls:
+            cached_entry = self._extract_cache.get(url)
+            if cached_entry is None:
                 continue
-
-            source = SourceData(
-                number=i,
-                title=result.get("url", "").split("/")[-1] or "Extracted Content",
-                url=result.get("url", ""),
-                snippet="",
-                full_content=result.get("raw_content", ""),
-                char_count=len(result.get("raw_content", "")),
-            )
-            sources.append(source)
-
-        failed_urls = response.get("failed_results", [])
-        if failed_urls:
-            logger.warning(f"⚠️ Failed to extract {len(failed_urls)} URLs: {failed_urls}")
-
-        return sources
+            if cached_entry[0] <= now:
+                del self._extract_cache[url]
+                self._extract_cache_chars -= cached_entry[1].char_count
+                continue
+            self._extract_cache.move_to_end(url)
+            cached[url] = cached_entry[1].model_copy()
+
+        urls_to_extract = [url for url in urls if url not in cached]
+        logger.info(f"📄 Tavily extract: {len(urls_to_extract)} URLs ({len(cached)} cached)")
+        extracted: dict[str, SourceData] = {}
+        if urls_to_extract:
+            response = await self._client.extract(urls=urls_to_extract)
+
+            for result in response.get("results", []):
+                url = result.get("url")
+                if not url:
+                    continue
+
+                raw_content = result.get("raw_content", "")
+                source = SourceData(
+                    number=0,
+                    title=url.rpartition("/")[2] or "Extracted Content",
+                    url=url,
+                    snippet="",
+                    full_content=raw_content,
+                    char_count=len(raw_content),
+                )
+                extracted[url] = source
+                self._cache_extracted(source, now)
+
+            failed_urls = response.get("failed_results", [])
+            if failed_urls:
+                logger.warning(f"⚠️ Failed to extract {len(failed_urls)} URLs: {failed_urls}")
+
+        # Sources keep the requested URL order: callers number new sources in the order they receive them
+        sources = []
+        for url in dict.fromkeys(urls):
+            if url in cached:
+                sources.append(cached[url])
+            elif url in extracted:
+                sources.append(extracted.pop(url))
+        # Pages that Tavily reported under a different URL than requested go last
+        sources.extend(extracted.values())
+        return self.rearrange_sources(sources, starting_number=0)
+
+    def _cache_extracted(self, source: SourceData, now: float) -> None:
+        """Store extracted page content, evicting the least recently used
+        pages once the total size exceeds the limit."""
+        if not self._extract_cache_size or source.char_count > self._extract_cache_size:
+            return
+        previous = self._extract_cache.pop(source.url, None)
+        if previous is not None:
+            self._extract_cache_chars -= previous[1].char_count
+        self._extract_cache[source.url] = (now + self._extract_cache_ttl, source.model_copy())
+        self._extract_cache_chars += source.char_count
+        while self._extract_cache_chars > self._extract_cache_size:
+            _, (_, evicted) = self._extract_cache.popitem(last=False)
+            self._extract_cache_chars -= evicted.char_count
 
     def _convert_to_source_data(self, response: dict) -> list[SourceData]:
         """Convert Tavily response to SourceData list."""
@@ -13,6 +13,12 @@ import yaml
 from envyaml import EnvYAML
 from pydantic import BaseModel, Field
 
+try:
+    # C-реализация загрузчика из libyaml, если PyYAML собран с ней
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader
+
 
 class OpenAIConfig(BaseModel):
     """OpenAI API settings."""
@@ -36,6 +42,12 @@ class SearchConfig(BaseModel):
     """Search settings."""
 
     max_results: int = Field(default=10, ge=1, description="Maximum number of search results")
+    cache_size: int = Field(default=256, ge=0, description="Maximum number of cached search requests")
+    cache_ttl: float = Field(default=600.0, gt=0, description="Lifetime of cached search results in seconds")
+    extract_cache_size: int = Field(
+        default=2_000_000, ge=0, description="Maximum total characters of cached extracted page content"
+    )
+    extract_cache_ttl: float = Field(default=600.0, gt=0, description="Lifetime of cached extracted pages in seconds")
 
 
 class ScrapingConfig(BaseModel):
@@ -114,7 +126,7 @@ def setup_logging() -> None:
         raise FileNotFoundError(f"Logging config file not found: {logging_config_path}")
 
     with open(logging_config_path, "r", encoding="utf-8") as f:
-        logging_config = yaml.safe_load(f)
+        logging_config = yaml.load(f, Loader=YAMLSafeLoader)
 
     logs_dir = Path(get_config().execution.logs_dir)
     logs_dir.mkdir(parents=True, exist_ok=True)